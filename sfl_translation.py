@@ -3,23 +3,361 @@ SFL Translation Agent - Linguistically-informed translation system
 Based on Systemic Functional Linguistics principles
 """
 
-from typing import Dict, List, Optional, Union
+from typing import Any, Callable, Dict, FrozenSet, List, Optional, Tuple, Union
+import asyncio
+import dataclasses
+import importlib
+import importlib.util
 import re
+import string
+import sys
+import threading
 from dataclasses import dataclass
-from enum import Enum
+from functools import lru_cache
 
 
-class ProcessType(Enum):
+# ``slots=True`` needs Python 3.10; older interpreters keep ``__dict__``
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+# Upper bound on memoized analyses/translations held by SFLTranslator
+_CACHE_SIZE = 4096
+
+# Texts at least this long are analysed off the event loop by translate_async
+_EXECUTOR_MIN_LENGTH = 10000
+
+# ASCII texts at least this long are scanned by the numba kernel, if present
+_JIT_MIN_LENGTH = 1024
+
+# ASCII texts at least this long are scanned by Hyperscan, if present;
+# below it the per-scan setup costs more than Aho-Corasick's whole scan
+_HYPERSCAN_MIN_LENGTH = 256
+
+
+# Interned analysis labels: equal labels are the same object, so downstream
+# aggregation can compare with ``is`` and reuse the cached string hash
+MOOD_DECLARATIVE = sys.intern("declarative")
+MOOD_INTERROGATIVE = sys.intern("interrogative")
+MOOD_EXCLAMATIVE = sys.intern("exclamative")
+FIELD_BUSINESS = sys.intern("business")
+FIELD_GENERAL = sys.intern("general")
+TENOR_FORMAL = sys.intern("formal")
+TENOR_NEUTRAL = sys.intern("neutral")
+MODE_WRITTEN = sys.intern("written")
+
+# SFL marker sets, allocated once at import time
+_VERBAL = frozenset({"said", "announced", "told", "asked"})
+_MENTAL = frozenset({"think", "believe", "know", "feel"})
+_MATERIAL = frozenset({"do", "make", "create", "build"})
+_BUSINESS = frozenset({"committee", "merger", "ceo", "proposal"})
+_FORMAL = frozenset({"shall", "herein", "aforementioned"})
+_COHESION = frozenset({"however", "therefore", "moreover", "thus"})
+
+# Markers by category; every scanner below is built from this table
+_MARKERS: Dict[str, FrozenSet[str]] = {
+    "verbal": _VERBAL,
+    "mental": _MENTAL,
+    "material": _MATERIAL,
+    "business": _BUSINESS,
+    "formal": _FORMAL,
+    "cohesion": _COHESION,
+}
+
+# All markers are compiled once at import time into a single alternation
+# with one named group per category, so a text is scanned in one pass and
+# each hit is classified by ``match.lastgroup``. It runs on the output of
+# _fold_ascii_case, like the Aho-Corasick scanner, so both agree on case.
+_MARKER_RE = re.compile(
+    r"\b(?:"
+    + "|".join(
+        f"(?P<{category}>{'|'.join(sorted(markers))})"
+        for category, markers in _MARKERS.items()
+    )
+    + r")\b"
+)
+
+# Markers are all ASCII, so only ASCII letters need folding; see
+# _fold_ascii_case
+_ASCII_LOWER = str.maketrans(string.ascii_uppercase, string.ascii_lowercase)
+
+# Mood signalled by a clause's final punctuation mark (default: declarative)
+_MOOD_TABLE = {"?": MOOD_INTERROGATIVE, "!": MOOD_EXCLAMATIVE}
+
+# First whitespace-delimited token, without tokenizing the rest of the text
+_THEME_RE = re.compile(r"\s*(\S+)")
+
+
+# Third-party packages (MT/LLM SDKs, spaCy, accelerators) are imported at
+# first use through this helper, never at module scope, so that importing
+# the module on the CLI start-up path only pays for the standard library.
+def _optional_import(name: str):
+    """Import an optional dependency on first use; None if it is missing"""
+    try:
+        return importlib.import_module(name)
+    except ImportError:
+        return None
+
+
+@lru_cache(maxsize=None)
+def _get_automaton():
+    """Build the Aho-Corasick marker automaton, or None without pyahocorasick"""
+    ahocorasick = _optional_import("ahocorasick")
+    if ahocorasick is None:
+        return None
+    
+    automaton = ahocorasick.Automaton()
+    for category, markers in _MARKERS.items():
+        for marker in markers:
+            automaton.add_word(marker, (category, marker))
+    automaton.make_automaton()
+    return automaton
+
+
+def _is_word_char(char: str) -> bool:
+    """Mirror the regex notion of a word character for boundary checks"""
+    return char.isalnum() or char == "_"
+
+
+def _fold_ascii_case(text: str) -> str:
+    """Lowercase ASCII letters only, keeping every character's position.
+    
+    str.lower() can change non-ASCII text (U+0130 becomes "i" plus a
+    combining dot), which would shift word boundaries; it is only used
+    on pure-ASCII text, where it is faster than str.translate().
+    """
+    return text.lower() if text.isascii() else text.translate(_ASCII_LOWER)
+
+
+def _scan_markers_regex(text: str) -> Dict[str, List[str]]:
+    """Bucket marker occurrences by category, in text order"""
+    hits: Dict[str, List[str]] = {}
+    for match in _MARKER_RE.finditer(_fold_ascii_case(text)):
+        # Every alternative is a named group, so lastgroup is always set
+        category = match.lastgroup
+        assert category is not None
+        # Intern so hits are the same objects the other scanners return
+        marker = sys.intern(match.group())
+        hits.setdefault(category, []).append(marker)
+    return hits
+
+
+def _scan_markers_automaton(text: str) -> Dict[str, List[str]]:
+    """Bucket marker occurrences by category using the Aho-Corasick automaton"""
+    text_lower = _fold_ascii_case(text)
+    last = len(text_lower) - 1
+    hits: Dict[str, List[str]] = {}
+    for end, (category, marker) in _get_automaton().iter(text_lower):
+        start = end - len(marker) + 1
+        # The automaton matches substrings; keep whole words only
+        if start > 0 and _is_word_char(text_lower[start - 1]):
+            continue
+        if end < last and _is_word_char(text_lower[end + 1]):
+            continue
+        hits.setdefault(category, []).append(marker)
+    return hits
+
+
+def _scan_ascii_markers(buf, marker_bytes, marker_offsets, letter_offsets,
+                        first) -> None:
+    """Record in ``first`` where each packed marker first occurs in ``buf``.
+    
+    Kept free of Python objects so numba can compile it: ``buf`` is the
+    ASCII text as uint8 and markers are lowercase, sorted, and grouped by
+    first letter (``letter_offsets[c]`` to ``letter_offsets[c + 1]`` for
+    letter ``c``). The text is walked one word at a time and only markers
+    sharing the word's first letter and length are compared, so matches
+    are whole-word and case-insensitive; unmatched markers keep -1.
+    """
+    n = buf.shape[0]
+    i = 0
+    while i < n:
+        char = buf[i]
+        if not (97 <= char <= 122 or 65 <= char <= 90 or 48 <= char <= 57
+                or char == 95):
+            i += 1
+            continue
+        
+        end = i + 1
+        while end < n:
+            nxt = buf[end]
+            if not (97 <= nxt <= 122 or 65 <= nxt <= 90 or 48 <= nxt <= 57
+                    or nxt == 95):
+                break
+            end += 1
+        
+        if 65 <= char <= 90:
+            char |= 0x20
+        if 97 <= char <= 122:
+            letter = char - 97
+            for j in range(letter_offsets[letter], letter_offsets[letter + 1]):
+                if first[j] >= 0:
+                    continue
+                start = marker_offsets[j]
+                size = marker_offsets[j + 1] - start
+                if size != end - i:
+                    continue
+                k = 1
+                while k < size:
+                    other = buf[i + k]
+                    if 65 <= other <= 90:
+                        other |= 0x20
+                    if other != marker_bytes[start + k]:
+                        break
+                    k += 1
+                if k == size:
+                    first[j] = i
+        i = end
+
+
+@lru_cache(maxsize=None)
+def _get_jit_scanner():
+    """Compile the numba marker scanner, or None without numba"""
+    numba = _optional_import("numba")
+    if numba is None:
+        return None
+    np = _optional_import("numpy")
+    
+    kernel = numba.njit(cache=True)(_scan_ascii_markers)
+    # Sorted by marker so that markers sharing a first letter are adjacent
+    entries = sorted(
+        ((category, marker)
+         for category, markers in _MARKERS.items()
+         for marker in markers),
+        key=lambda entry: entry[1],
+    )
+    marker_bytes = np.frombuffer(
+        "".join(marker for _, marker in entries).encode("ascii"), dtype=np.uint8
+    )
+    marker_offsets = np.cumsum([0] + [len(marker) for _, marker in entries])
+    letter_offsets = np.searchsorted(
+        [marker[0] for _, marker in entries], list(string.ascii_lowercase + "{")
+    )
+    
+    def scan(text: str) -> Dict[str, List[str]]:
+        """Bucket the first occurrence of each marker in an ASCII text"""
+        first = np.full(len(entries), -1, dtype=np.int64)
+        buf = np.frombuffer(text.encode("ascii"), dtype=np.uint8)
+        kernel(buf, marker_bytes, marker_offsets, letter_offsets, first)
+        
+        hits: Dict[str, List[str]] = {}
+        for index in sorted(np.flatnonzero(first >= 0), key=first.__getitem__):
+            category, marker = entries[index]
+            hits.setdefault(category, []).append(marker)
+        return hits
+    
+    return scan
+
+
+@lru_cache(maxsize=None)
+def _get_hyperscan_scanner():
+    """Compile every marker into one Hyperscan database, or None without it"""
+    hyperscan = _optional_import("hyperscan")
+    if hyperscan is None:
+        return None
+    entries = [
+        (category, marker)
+        for category, markers in _MARKERS.items()
+        for marker in sorted(markers)
+    ]
+    database = hyperscan.Database()
+    # Hyperscan's \b is ASCII-only (it rejects \b in UCP mode), so this
+    # database must only ever see ASCII text
+    database.compile(
+        expressions=[
+            rb"\b" + marker.encode("ascii") + rb"\b" for _, marker in entries
+        ],
+        ids=list(range(len(entries))),
+        elements=len(entries),
+        # Only the first match of each marker is needed, which also bounds
+        # the Python callbacks per scan by the number of markers
+        flags=[hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_SINGLEMATCH]
+        * len(entries),
+    )
+    # Scratch space must not be shared between concurrently scanning threads
+    local = threading.local()
+    
+    def scan(text: str) -> Dict[str, List[str]]:
+        """Bucket the first occurrence of each marker in an ASCII text"""
+        scratch = getattr(local, "scratch", None)
+        if scratch is None:
+            scratch = local.scratch = hyperscan.Scratch(database)
+        
+        found = []
+        
+        def on_match(index, start, end, flags, context):
+            found.append((end, index))
+        
+        database.scan(text.encode("ascii"), match_event_handler=on_match,
+                      scratch=scratch)
+        
+        hits: Dict[str, List[str]] = {}
+        for _, index in sorted(found):
+            category, marker = entries[index]
+            hits.setdefault(category, []).append(marker)
+        return hits
+    
+    return scan
+
+
+def _build_scanner():
+    """Specialize the marker scanner to the accelerators that are installed"""
+    base_scan = (
+        _scan_markers_automaton if _get_automaton() is not None
+        else _scan_markers_regex
+    )
+    # Hyperscan is the fastest backend on ASCII prose past a few hundred
+    # characters; short texts stay on the base scanner
+    hyperscan_scan = _get_hyperscan_scanner()
+    if hyperscan_scan is not None:
+        def scan(text: str) -> Dict[str, List[str]]:
+            if len(text) >= _HYPERSCAN_MIN_LENGTH and text.isascii():
+                return hyperscan_scan(text)
+            return base_scan(text)
+        
+        return scan
+    
+    if importlib.util.find_spec("numba") is None:
+        return base_scan
+    
+    # Importing numba and loading/compiling the kernel takes about a second,
+    # so do it off the calling thread; long texts use base_scan until then
+    jit_ready: List[Callable[[str], Dict[str, List[str]]]] = []
+    
+    def warm_up() -> None:
+        jit_scan = _get_jit_scanner()
+        if jit_scan is not None:
+            jit_scan(" ")
+            jit_ready.append(jit_scan)
+    
+    threading.Thread(target=warm_up, name="sfl-jit-warm-up", daemon=True).start()
+    
+    def scan(text: str) -> Dict[str, List[str]]:
+        if jit_ready and len(text) >= _JIT_MIN_LENGTH and text.isascii():
+            return jit_ready[0](text)
+        return base_scan(text)
+    
+    return scan
+
+
+def _scan_markers(text: str) -> Dict[str, List[str]]:
+    """Bucket marker occurrences with the fastest scanner available"""
+    # Backend availability is fixed for the process, so resolve it on the
+    # first call and rebind this name to the specialized scanner
+    global _scan_markers
+    _scan_markers = _build_scanner()
+    return _scan_markers(text)
+
+
+class ProcessType:
     """SFL Process Types from Transitivity System"""
-    MATERIAL = "material"
-    MENTAL = "mental"
-    RELATIONAL = "relational"
-    VERBAL = "verbal"
-    BEHAVIORAL = "behavioral"
-    EXISTENTIAL = "existential"
+    MATERIAL = sys.intern("material")
+    MENTAL = sys.intern("mental")
+    RELATIONAL = sys.intern("relational")
+    VERBAL = sys.intern("verbal")
+    BEHAVIORAL = sys.intern("behavioral")
+    EXISTENTIAL = sys.intern("existential")
 
 
-class Register(Enum):
+class Register:
     """Register types for translation"""
     FORMAL = "formal"
     INFORMAL = "informal"
@@ -29,17 +367,66 @@ class Register(Enum):
     TECHNICAL = "technical"
 
 
-@dataclass
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
 class SFLAnalysis:
-    """SFL linguistic analysis output"""
-    transitivity: Dict[str, any]
+    """SFL linguistic analysis output (immutable, so it can be cached)"""
+    process_type: str
+    participants: Tuple[str, ...]
+    circumstances: Tuple[str, ...]
     mood: str
     theme: str
-    register: Dict[str, str]
-    cohesion_markers: List[str]
+    field: str
+    tenor: str
+    cohesion_markers: Tuple[str, ...]
+    mode: str = MODE_WRITTEN
+    
+    @property
+    def transitivity(self) -> Dict[str, Any]:
+        """Transitivity variables grouped as a dict"""
+        return {
+            "process_type": self.process_type,
+            "participants": self.participants,
+            "circumstances": self.circumstances
+        }
+    
+    @property
+    def register(self) -> Dict[str, str]:
+        """Register variables (field, tenor, mode) grouped as a dict"""
+        return {"field": self.field, "tenor": self.tenor, "mode": self.mode}
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
+class SFLAnalysisBatch:
+    """Column-wise SFL analyses for a batch of texts (row i is text i)"""
+    process_type: List[str] = dataclasses.field(default_factory=list)
+    participants: List[Tuple[str, ...]] = dataclasses.field(default_factory=list)
+    circumstances: List[Tuple[str, ...]] = dataclasses.field(default_factory=list)
+    mood: List[str] = dataclasses.field(default_factory=list)
+    theme: List[str] = dataclasses.field(default_factory=list)
+    field: List[str] = dataclasses.field(default_factory=list)
+    tenor: List[str] = dataclasses.field(default_factory=list)
+    cohesion_markers: List[Tuple[str, ...]] = dataclasses.field(default_factory=list)
+    mode: List[str] = dataclasses.field(default_factory=list)
+    
+    def __len__(self) -> int:
+        return len(self.process_type)
+    
+    def __getitem__(self, index: int) -> SFLAnalysis:
+        """Materialize the analysis of a single text"""
+        return SFLAnalysis(
+            process_type=self.process_type[index],
+            participants=self.participants[index],
+            circumstances=self.circumstances[index],
+            mood=self.mood[index],
+            theme=self.theme[index],
+            field=self.field[index],
+            tenor=self.tenor[index],
+            cohesion_markers=self.cohesion_markers[index],
+            mode=self.mode[index]
+        )
+
+
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
 class TranslationResult:
     """Translation output with linguistic analysis"""
     translation: str
@@ -61,6 +448,8 @@ class SFLTranslator:
         self.target_lang = target_lang
         self.register = register
         self.localize = localize
+        # Formatted once per translator rather than on every call
+        self._translation_prefix = f"[Translated to {target_lang}]: "
         
     def translate(self, text: str, preserve_register: bool = True,
                  cultural_adaptation: bool = False, analyze: bool = False,
@@ -74,6 +463,45 @@ class SFLTranslator:
         sfl_features = self._extract_sfl_features(text) if analyze else None
         translated_text = self._perform_translation(text, region)
         
+        return self._make_result(text, translated_text, sfl_features)
+    
+    async def translate_async(self, text: str, preserve_register: bool = True,
+                              cultural_adaptation: bool = False,
+                              analyze: bool = False,
+                              region: Optional[str] = None) -> TranslationResult:
+        """
+        Translate text without blocking the event loop on the service call
+        """
+        sfl_features = None
+        if analyze:
+            # Analysis is CPU-bound; only hand long texts to a worker thread
+            if len(text) >= _EXECUTOR_MIN_LENGTH:
+                loop = asyncio.get_running_loop()
+                sfl_features = await loop.run_in_executor(
+                    None, self._extract_sfl_features, text)
+            else:
+                sfl_features = self._extract_sfl_features(text)
+        translated_text = await self._perform_translation_async(text, region)
+        
+        return self._make_result(text, translated_text, sfl_features)
+    
+    def translate_batch(self, texts: List[str], preserve_register: bool = True,
+                        cultural_adaptation: bool = False, analyze: bool = False,
+                        region: Optional[str] = None) -> List[TranslationResult]:
+        """
+        Translate several texts, reusing cached analyses when requested
+        """
+        extract = self._extract_sfl_features
+        
+        return [
+            self._make_result(text, self._perform_translation(text, region),
+                              extract(text) if analyze else None)
+            for text in texts
+        ]
+    
+    def _make_result(self, text: str, translated_text: str,
+                     sfl_features: Optional[SFLAnalysis]) -> TranslationResult:
+        """Assemble the result of translating `text` with this translator"""
         return TranslationResult(
             translation=translated_text,
             source_text=text,
@@ -83,101 +511,139 @@ class SFLTranslator:
             confidence=0.92
         )
     
-    def _extract_sfl_features(self, text: str) -> SFLAnalysis:
+    def analyze_batch(self, texts: List[str]) -> SFLAnalysisBatch:
+        """Extract SFL features for several texts into a column-wise batch"""
+        batch = SFLAnalysisBatch()
+        columns = [
+            (f.name, getattr(batch, f.name)) for f in dataclasses.fields(batch)
+        ]
+        
+        extract = self._extract_sfl_features
+        for text in texts:
+            analysis = extract(text)
+            for name, column in columns:
+                column.append(getattr(analysis, name))
+        
+        return batch
+    
+    @classmethod
+    def clear_cache(cls) -> None:
+        """Drop memoized analyses and translations (for long-running agents)"""
+        cls._extract_sfl_features.cache_clear()
+        cls._translate_cached.cache_clear()
+    
+    @classmethod
+    @lru_cache(maxsize=_CACHE_SIZE)
+    def _extract_sfl_features(cls, text: str) -> SFLAnalysis:
         """Extract SFL linguistic features from source text"""
-        # Simplified transitivity analysis
-        process_type = self._detect_process_type(text)
-        mood = self._analyze_mood(text)
-        theme = self._identify_theme(text)
-        register = self._detect_register(text)
+        return SFLAnalysis(**cls._extract_all(text))
+    
+    @classmethod
+    def _extract_all(cls, text: str) -> Dict[str, Any]:
+        """Extract every SFL feature from a single scan of the text"""
+        hits = _scan_markers(text)
         
-        return SFLAnalysis(
-            transitivity={
-                "process_type": process_type,
-                "participants": self._extract_participants(text),
-                "circumstances": self._extract_circumstances(text)
-            },
-            mood=mood,
-            theme=theme,
-            register=register,
-            cohesion_markers=self._find_cohesion_markers(text)
-        )
+        return {
+            "process_type": cls._detect_process_type(hits),
+            "participants": cls._extract_participants(text),
+            "circumstances": cls._extract_circumstances(text),
+            "mood": cls._analyze_mood(text),
+            "theme": cls._identify_theme(text),
+            "cohesion_markers": cls._find_cohesion_markers(hits),
+            **cls._detect_register(hits)
+        }
     
-    def _detect_process_type(self, text: str) -> str:
+    @staticmethod
+    def _detect_process_type(hits: Dict[str, List[str]]) -> str:
         """Identify main process type (transitivity)"""
         # Simplified heuristic detection
-        verbal_markers = ["said", "announced", "told", "asked"]
-        mental_markers = ["think", "believe", "know", "feel"]
-        material_markers = ["do", "make", "create", "build"]
-        
-        text_lower = text.lower()
-        
-        if any(marker in text_lower for marker in verbal_markers):
-            return "verbal"
-        elif any(marker in text_lower for marker in mental_markers):
-            return "mental"
-        elif any(marker in text_lower for marker in material_markers):
-            return "material"
+        if "verbal" in hits:
+            return ProcessType.VERBAL
+        elif "mental" in hits:
+            return ProcessType.MENTAL
+        elif "material" in hits:
+            return ProcessType.MATERIAL
         else:
-            return "relational"
+            return ProcessType.RELATIONAL
     
-    def _analyze_mood(self, text: str) -> str:
+    @staticmethod
+    def _analyze_mood(text: str) -> str:
         """Determine mood (declarative/interrogative/imperative)"""
-        if text.strip().endswith("?"):
-            return "interrogative"
-        elif text.strip().endswith("!"):
-            return "exclamative"
-        else:
-            return "declarative"
+        stripped = text.rstrip()
+        if not stripped:
+            return MOOD_DECLARATIVE
+        return _MOOD_TABLE.get(stripped[-1], MOOD_DECLARATIVE)
     
-    def _identify_theme(self, text: str) -> str:
+    @staticmethod
+    def _identify_theme(text: str) -> str:
         """Extract thematic element (first clause element)"""
-        words = text.split()
-        return words[0] if words else ""
+        match = _THEME_RE.match(text)
+        return match.group(1) if match else ""
     
-    def _detect_register(self, text: str) -> Dict[str, str]:
+    @classmethod
+    def _detect_register(cls, hits: Dict[str, List[str]]) -> Dict[str, str]:
         """Detect register variables (field, tenor, mode)"""
         return {
-            "field": self._detect_field(text),
-            "tenor": self._detect_tenor(text),
-            "mode": "written"
+            "field": cls._detect_field(hits),
+            "tenor": cls._detect_tenor(hits),
+            "mode": MODE_WRITTEN
         }
     
-    def _detect_field(self, text: str) -> str:
+    @staticmethod
+    def _detect_field(hits: Dict[str, List[str]]) -> str:
         """Detect semantic field/domain"""
-        business_terms = ["committee", "merger", "CEO", "proposal"]
-        if any(term in text for term in business_terms):
-            return "business"
-        return "general"
+        if "business" in hits:
+            return FIELD_BUSINESS
+        return FIELD_GENERAL
     
-    def _detect_tenor(self, text: str) -> str:
+    @staticmethod
+    def _detect_tenor(hits: Dict[str, List[str]]) -> str:
         """Detect tenor (formality/power relations)"""
-        formal_markers = ["shall", "herein", "aforementioned"]
-        if any(marker in text.lower() for marker in formal_markers):
-            return "formal"
-        return "neutral"
+        if "formal" in hits:
+            return TENOR_FORMAL
+        return TENOR_NEUTRAL
     
-    def _extract_participants(self, text: str) -> List[str]:
+    @staticmethod
+    def _extract_participants(text: str) -> Tuple[str, ...]:
         """Extract participant roles"""
         # Simplified NP extraction
-        return []
+        return ()
     
-    def _extract_circumstances(self, text: str) -> List[str]:
+    @staticmethod
+    def _extract_circumstances(text: str) -> Tuple[str, ...]:
         """Extract circumstantial elements"""
-        return []
+        return ()
     
-    def _find_cohesion_markers(self, text: str) -> List[str]:
+    @staticmethod
+    def _find_cohesion_markers(hits: Dict[str, List[str]]) -> Tuple[str, ...]:
         """Identify cohesive devices"""
-        markers = ["however", "therefore", "moreover", "thus"]
-        return [m for m in markers if m in text.lower()]
+        # Each device is reported once, in order of first occurrence
+        return tuple(dict.fromkeys(hits.get("cohesion", ())))
     
     def _perform_translation(self, text: str, region: Optional[str] = None) -> str:
         """
         Perform actual translation (placeholder for API call)
         In production: would integrate with translation API/LLM
         """
+        return self._translation_prefix + self._translate_cached(
+            self.source_lang, self.target_lang, text, region)
+    
+    async def _perform_translation_async(self, text: str,
+                                         region: Optional[str] = None) -> str:
+        """
+        Awaitable counterpart of _perform_translation
+        In production: would await an async translation API/LLM client
+        """
+        # Placeholder - the translation service has no network client yet
+        return self._perform_translation(text, region)
+    
+    @staticmethod
+    @lru_cache(maxsize=_CACHE_SIZE)
+    def _translate_cached(source_lang: str, target_lang: str, text: str,
+                          region: Optional[str] = None) -> str:
+        """Memoized translation keyed on language pair, text and region"""
         # Placeholder - would call translation service
-        return f"[Translated to {self.target_lang}]: {text}"
+        return text
 
 
 class TranslationAgent:
@@ -190,13 +656,14 @@ class TranslationAgent:
         self.agent_id = agent_id
         self.supported_languages = supported_languages
         self.mode = mode
-        self.callbacks = {}
         self.is_running = False
+        self._on_complete: Optional[Callable[[TranslationResult], Any]] = None
+        self._translators: Dict[Tuple[str, str], SFLTranslator] = {}
         
     def register_callback(self, on_translation_complete=None):
         """Register callback functions for agent events"""
         if on_translation_complete:
-            self.callbacks["on_complete"] = on_translation_complete
+            self._on_complete = on_translation_complete
     
     def start(self):
         """Start agent in orchestration mode"""
@@ -208,15 +675,50 @@ class TranslationAgent:
         self.is_running = False
         print(f"Translation Agent {self.agent_id} stopped")
     
-    def translate(self, text: str, source_lang: str, target_lang: str) -> str:
-        """Agent translation interface"""
-        translator = SFLTranslator(source_lang, target_lang)
+    def _get_translator(self, source_lang: str, target_lang: str) -> SFLTranslator:
+        """Reuse one translator per language pair across requests"""
+        key = (source_lang, target_lang)
+        translator = self._translators.get(key)
+        if translator is None:
+            translator = self._translators[key] = SFLTranslator(source_lang, target_lang)
+        return translator
+    
+    def translate(self, text: Union[str, List[str]], source_lang: str,
+                  target_lang: str) -> Union[str, List[str]]:
+        """Agent translation interface (a list of texts is translated as a batch)"""
+        translator = self._get_translator(source_lang, target_lang)
+        if not isinstance(text, str):
+            results = translator.translate_batch(text)
+            on_complete = self._on_complete
+            if on_complete is not None:
+                for result in results:
+                    on_complete(result)
+            return [result.translation for result in results]
+        
         result = translator.translate(text)
         
-        if "on_complete" in self.callbacks:
-            self.callbacks["on_complete"](result)
+        if self._on_complete is not None:
+            self._on_complete(result)
         
         return result.translation
+    
+    async def translate_many(self, texts: List[str], source_lang: str,
+                             target_lang: str, concurrency: int = 8) -> List[str]:
+        """Translate texts concurrently, at most `concurrency` in flight"""
+        if concurrency < 1:
+            raise ValueError("concurrency must be >= 1")
+        
+        translator = self._get_translator(source_lang, target_lang)
+        semaphore = asyncio.Semaphore(concurrency)
+        
+        async def bounded(text: str) -> str:
+            async with semaphore:
+                result = await translator.translate_async(text)
+            if self._on_complete is not None:
+                self._on_complete(result)
+            return result.translation
+        
+        return list(await asyncio.gather(*[bounded(text) for text in texts]))
 
 
 # Example usage
@@ -231,6 +733,6 @@ if __name__ == "__main__":
     
     print(f"Translation: {result.translation}")
     if result.sfl_analysis:
-        print(f"Process Type: {result.sfl_analysis.transitivity['process_type']}")
+        print(f"Process Type: {result.sfl_analysis.process_type}")
         print(f"Mood: {result.sfl_analysis.mood}")
         print(f"Theme: {result.sfl_analysis.theme}")
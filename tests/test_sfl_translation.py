@@ -0,0 +1,82 @@
+"""Tests for the SFL translation module"""
+
+import random
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+import sfl_translation
+
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# Third-party packages that must never be imported by `import sfl_translation`
+HEAVY_PACKAGES = {
+    "ahocorasick", "aiohttp", "hyperscan", "nltk", "numba", "numpy",
+    "pandas", "spacy", "torch", "transformers",
+}
+
+WORDS = [
+    "said", "Announced", "TOLD", "asked", "think", "believe", "knowledge",
+    "do", "doing", "document", "make", "Create", "build", "committee",
+    "merger", "CEO", "ceos", "proposal", "shall", "herein",
+    "aforementioned", "however", "Therefore", "moreover", "thus", "the",
+    "a", "of", "lorem", "ipsum", "9do", "do_", "_thus",
+]
+SEPARATORS = [" ", "  ", ", ", ". ", "-", "_", "\n", "!", "?", ""]
+NON_ASCII = ["é", "İ", "ſ", "̇", "日本", "ß"]
+
+
+def _first_occurrences(hits):
+    """Reduce scanner output to each marker's first occurrence, in order"""
+    return {category: list(dict.fromkeys(markers))
+            for category, markers in hits.items()}
+
+
+def _random_texts(rng, count, ascii_only):
+    separators = SEPARATORS if ascii_only else SEPARATORS + NON_ASCII
+    texts = []
+    for _ in range(count):
+        # Long enough to exercise the length-gated backends as well
+        size = rng.choice([0, 1, 5, 40, 400])
+        texts.append("".join(
+            rng.choice(WORDS) + rng.choice(separators) for _ in range(size)
+        ))
+    return texts
+
+
+def test_import_pulls_in_no_heavy_dependencies():
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import sfl_translation"],
+        cwd=ROOT, capture_output=True, text=True, check=True,
+    )
+    imported = {
+        line.rsplit("|", 1)[-1].strip().split(".")[0]
+        for line in result.stderr.splitlines()
+        if line.startswith("import time:")
+    }
+    assert "sfl_translation" in imported
+    assert not imported & HEAVY_PACKAGES
+
+
+@pytest.mark.parametrize("backend", ["automaton", "numba", "hyperscan"])
+def test_scanner_backends_agree_with_regex(backend):
+    rng = random.Random(0)
+    if backend == "automaton":
+        pytest.importorskip("ahocorasick")
+        scan = sfl_translation._scan_markers_automaton
+        texts = _random_texts(rng, 2000, ascii_only=False)
+    elif backend == "numba":
+        pytest.importorskip("numba")
+        scan = sfl_translation._get_jit_scanner()
+        texts = _random_texts(rng, 2000, ascii_only=True)
+    else:
+        pytest.importorskip("hyperscan")
+        scan = sfl_translation._get_hyperscan_scanner()
+        texts = _random_texts(rng, 2000, ascii_only=True)
+
+    for text in texts:
+        expected = sfl_translation._scan_markers_regex(text)
+        assert _first_occurrences(scan(text)) == _first_occurrences(expected), text